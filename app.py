@@ -1,5 +1,20 @@
 import os
-import requests
+import re
+import json
+import glob
+import tempfile
+import asyncio
+import hashlib
+import importlib.util
+import threading
+import time
+from collections import deque
+from itertools import count
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import httpx
+from cachetools import TTLCache
 import gradio as gr
 from dotenv import load_dotenv
 
@@ -11,55 +26,92 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 MURFAI_API_KEY = os.getenv("MURFAI_API_KEY")
 MURFAI_USER_ID = os.getenv("MURFAI_USER_ID")
 
+# Shared pool for blocking work (file I/O, embeddings) so it never stalls the event loop
+_pool = ThreadPoolExecutor(max_workers=8)
+
+async def run_blocking(func, *args):
+    """Run a blocking call on the shared thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_pool, func, *args)
+
 # Try to import LangChain components with fallback
 LANGCHAIN_AVAILABLE = False
-llm_chain = None
 
 try:
     from langchain_openai import ChatOpenAI
     from langchain.chains import LLMChain
-    from langchain.prompts import PromptTemplate
-    from langchain.memory import ConversationBufferMemory
+    from langchain.prompts import ChatPromptTemplate
+    from langchain.memory import ConversationTokenBufferMemory
+    from langchain.callbacks import AsyncIteratorCallbackHandler
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+    from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
     LANGCHAIN_AVAILABLE = True
     print("✓ LangChain imports successful")
 except ImportError as e:
     print(f"⚠ LangChain import error: {e}")
     print("⚠ Continuing with fallback text responses")
 
-# Initialize LangChain only if available and API key is present
-if LANGCHAIN_AVAILABLE and OPENAI_API_KEY:
+# Semantic response cache is optional
+SEMANTIC_CACHE_AVAILABLE = False
+
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠ Semantic cache disabled: {e}")
+
+# Build the LangChain chain lazily: constructing ChatOpenAI and its memory is
+# deferred from import (and every worker start) to the first LLM turn
+MEMORY_MAX_TOKENS = 1024
+
+@lru_cache(maxsize=1)
+def get_chain():
+    """Return the conversation chain, or None if LangChain can't be used"""
+    if not (LANGCHAIN_AVAILABLE and OPENAI_API_KEY):
+        return None
     try:
-        template = """As an adventurous and globetrotting college student, you're constantly on the lookout for new cultures, experiences, and breathtaking landscapes. You've visited numerous countries, immersing yourself in local traditions, and you're always eager to swap travel stories and offer tips on exciting destinations.
-        {chat_history}
-        User: {user_message}
-        Chatbot:"""
-
-        prompt = PromptTemplate(
-            input_variables=["chat_history", "user_message"], 
-            template=template
+        persona = """As an adventurous and globetrotting college student, you're constantly on the lookout for new cultures, experiences, and breathtaking landscapes. You've visited numerous countries, immersing yourself in local traditions, and you're always eager to swap travel stories and offer tips on exciting destinations."""
+
+        # Fixed persona first so every request shares a prefix OpenAI can cache;
+        # only the trailing message varies between turns
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", persona),
+            ("human", "{chat_history}\nUser: {user_message}\nChatbot:"),
+        ])
+
+        llm = ChatOpenAI(
+            temperature=0.5, 
+            model_name="gpt-3.5-turbo",
+            openai_api_key=OPENAI_API_KEY,
+            streaming=True,
+            # Retries are handled by _stream_llm_reply_with_retry
+            max_retries=0
         )
 
-        memory = ConversationBufferMemory(memory_key="chat_history")
+        # Keep only the most recent turns so prompt size stays bounded in long chats
+        memory = ConversationTokenBufferMemory(
+            llm=llm,
+            max_token_limit=MEMORY_MAX_TOKENS,
+            memory_key="chat_history"
+        )
 
         llm_chain = LLMChain(
-            llm=ChatOpenAI(
-                temperature=0.5, 
-                model_name="gpt-3.5-turbo",
-                openai_api_key=OPENAI_API_KEY
-            ),
+            llm=llm,
             prompt=prompt,
             verbose=False,
             memory=memory,
         )
         print("✓ LangChain initialized successfully")
+        return llm_chain
     except Exception as e:
         print(f"⚠ LangChain initialization failed: {e}")
-        llm_chain = None
-else:
-    if not OPENAI_API_KEY:
-        print("⚠ OPENAI_API_KEY not set")
-    if not LANGCHAIN_AVAILABLE:
-        print("⚠ LangChain not available")
+        return None
+
+if not OPENAI_API_KEY:
+    print("⚠ OPENAI_API_KEY not set")
+if not LANGCHAIN_AVAILABLE:
+    print("⚠ LangChain not available")
 
 # Fallback responses if LangChain fails
 FALLBACK_RESPONSES = {
@@ -70,161 +122,541 @@ FALLBACK_RESPONSES = {
     "one country": "That's tough! I'd probably choose Japan - it has this perfect blend of ancient tradition and futuristic innovation, amazing food, and the people are incredibly kind."
 }
 
+# Keywords that select a fallback response; topics earlier in FALLBACK_RESPONSES win
+FALLBACK_KEYWORDS = {
+    "memorable": "travel experience",
+    "experience": "travel experience",
+    "hidden": "hidden gem",
+    "gem": "hidden gem",
+    "prepare": "prepare for trip",
+    "culture": "prepare for trip",
+    "adventure": "adventure sport",
+    "sport": "adventure sport",
+    "one country": "one country",
+    "rest of your life": "one country",
+}
+FALLBACK_PRIORITY = {topic: rank for rank, topic in enumerate(FALLBACK_RESPONSES)}
+
+# One regex scan instead of a substring test per keyword
+_fallback_keywords_re = re.compile("|".join(map(re.escape, FALLBACK_KEYWORDS)))
+
 def get_fallback_response(message):
     """Provide fallback responses when LangChain is unavailable"""
-    message_lower = message.lower()
+    topics = {
+        FALLBACK_KEYWORDS[match.group(0)]
+        for match in _fallback_keywords_re.finditer(message.lower())
+    }
     
-    if "memorable" in message_lower or "experience" in message_lower:
-        return FALLBACK_RESPONSES["travel experience"]
-    elif "hidden" in message_lower or "gem" in message_lower:
-        return FALLBACK_RESPONSES["hidden gem"]
-    elif "prepare" in message_lower or "culture" in message_lower:
-        return FALLBACK_RESPONSES["prepare for trip"]
-    elif "adventure" in message_lower or "sport" in message_lower:
-        return FALLBACK_RESPONSES["adventure sport"]
-    elif "one country" in message_lower or "rest of your life" in message_lower:
-        return FALLBACK_RESPONSES["one country"]
+    if topics:
+        return FALLBACK_RESPONSES[min(topics, key=FALLBACK_PRIORITY.get)]
     else:
         return "I'd love to share more about my travel adventures! While I'm having some technical difficulties with my full capabilities, I can tell you about amazing destinations, travel tips, or cultural experiences. What would you like to know?"
 
-def get_text_response(user_message):
-    """Get text response from LLM or fallback"""
-    if llm_chain and OPENAI_API_KEY:
+# Cache of LLM replies so repeated turns (e.g. the example questions) skip the API.
+# Replies depend on the conversation so far, so the visible history is part of the key.
+_text_cache = TTLCache(maxsize=512, ttl=3600)
+_text_cache_lock = threading.Lock()
+
+def _text_cache_key(user_message, history):
+    normalized_message = " ".join(user_message.lower().split())
+    return normalized_message, tuple(tuple(turn) for turn in history or ())
+
+# Semantic cache over recent opening replies: near-duplicate first questions reuse
+# an earlier answer, skipping both OpenAI and Murf (the reply's audio is cached too)
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_SIZE = 1024
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+_semantic_index = None
+_semantic_replies = {}
+_semantic_ids = count()
+_semantic_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_embedder():
+    """Load the sentence embedding model on first use"""
+    return SentenceTransformer(SEMANTIC_CACHE_MODEL)
+
+def _semantic_lookup(user_message):
+    """Embed the message and return (embedding, cached reply or None)"""
+    embedding = _get_embedder().encode([user_message], normalize_embeddings=True)
+    embedding = np.asarray(embedding, dtype="float32")
+    
+    with _semantic_lock:
+        if _semantic_index is None or _semantic_index.ntotal == 0:
+            return embedding, None
+        scores, ids = _semantic_index.search(embedding, 1)
+        if scores[0][0] >= SEMANTIC_CACHE_THRESHOLD:
+            return embedding, _semantic_replies.get(int(ids[0][0]))
+    return embedding, None
+
+def _semantic_store(embedding, reply):
+    """Add a reply to the semantic cache, evicting the oldest beyond the size limit"""
+    global _semantic_index
+    
+    with _semantic_lock:
+        if _semantic_index is None:
+            # Inner product over normalized embeddings is cosine similarity
+            _semantic_index = faiss.IndexIDMap(faiss.IndexFlatIP(embedding.shape[1]))
+        reply_id = next(_semantic_ids)
+        _semantic_index.add_with_ids(embedding, np.array([reply_id], dtype="int64"))
+        _semantic_replies[reply_id] = reply
+        
+        if len(_semantic_replies) > SEMANTIC_CACHE_SIZE:
+            oldest_id = next(iter(_semantic_replies))
+            del _semantic_replies[oldest_id]
+            _semantic_index.remove_ids(np.array([oldest_id], dtype="int64"))
+
+async def _run_semantic_cache(func, *args):
+    """Run a semantic cache operation, disabling the cache if it fails"""
+    global SEMANTIC_CACHE_AVAILABLE
+    
+    try:
+        return await run_blocking(func, *args)
+    except Exception as e:
+        # e.g. the embedding model can't be downloaded; the cache is only an optimization
+        print(f"⚠ Semantic cache disabled: {e}")
+        SEMANTIC_CACHE_AVAILABLE = False
+        return None
+
+def _remember_turn(user_message, reply):
+    """Keep the conversation memory in step with a reply served from cache"""
+    get_chain().memory.save_context({"user_message": user_message}, {"text": reply})
+
+async def _stream_llm_reply(user_message):
+    """Yield the LLM reply as it grows, ending with the chain's final output"""
+    handler = AsyncIteratorCallbackHandler()
+    prediction = asyncio.create_task(
+        get_chain().apredict(user_message=user_message, callbacks=[handler])
+    )
+    # The handler only finishes on LLM end/error, so also stop if the chain fails earlier
+    prediction.add_done_callback(lambda _: handler.done.set())
+    
+    try:
+        partial_reply = ""
+        async for token in handler.aiter():
+            partial_reply += token
+            yield partial_reply
+        yield await prediction
+    finally:
+        prediction.cancel()
+
+# Retry transient OpenAI failures with backoff, and stop calling it altogether
+# for a while once it keeps failing
+LLM_MAX_ATTEMPTS = 3
+LLM_BREAKER_FAIL_MAX = 5
+LLM_BREAKER_RESET_TIMEOUT = 30
+
+_llm_failures = 0
+_llm_breaker_opened_at = None
+_llm_trial_started_at = None
+
+def _llm_circuit_open():
+    """Whether OpenAI is considered down and turns should go straight to the fallback
+    
+    Once the reset timeout has passed the breaker is half-open: a single turn
+    is let through as a trial call while the others keep using the fallback.
+    """
+    global _llm_trial_started_at
+    
+    if _llm_breaker_opened_at is None:
+        return False
+    now = time.monotonic()
+    if now - _llm_breaker_opened_at < LLM_BREAKER_RESET_TIMEOUT:
+        return True
+    # A trial that never reported back (e.g. its turn was abandoned) expires too
+    if _llm_trial_started_at is not None and now - _llm_trial_started_at < LLM_BREAKER_RESET_TIMEOUT:
+        return True
+    _llm_trial_started_at = now
+    return False
+
+def _record_llm_result(succeeded):
+    """Track consecutive LLM failures, opening the circuit after too many"""
+    global _llm_failures, _llm_breaker_opened_at, _llm_trial_started_at
+    
+    _llm_trial_started_at = None
+    if succeeded:
+        _llm_failures = 0
+        _llm_breaker_opened_at = None
+        return
+    _llm_failures += 1
+    if _llm_failures >= LLM_BREAKER_FAIL_MAX:
+        # Also restarts the timeout when the trial call after a reset fails
+        _llm_breaker_opened_at = time.monotonic()
+
+async def _stream_llm_reply_with_retry(user_message):
+    """Stream the LLM reply, restarting it on transient OpenAI errors"""
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(LLM_MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=4),
+        retry=retry_if_exception_type((APIConnectionError, InternalServerError, RateLimitError)),
+        reraise=True,
+    ):
+        with attempt:
+            # Each yield is the whole reply so far, so a restart simply redraws it
+            async for partial_reply in _stream_llm_reply(user_message):
+                yield partial_reply
+
+class LLMBatcher:
+    """Coalesce concurrent identical turns onto a single OpenAI request
+    
+    Each request runs in its own task, so it keeps going for the turns sharing
+    it even if the turn that started it disconnects.
+    """
+    
+    def __init__(self):
+        self._in_flight = {}
+        self._tasks = set()
+    
+    def is_in_flight(self, key):
+        """Whether an identical turn is already being answered"""
+        return key in self._in_flight
+    
+    async def stream(self, key, user_message, on_reply):
+        """Yield the reply for key as it grows, ending with the final reply (None on failure)
+        
+        on_reply is awaited with the final reply only if this call started the request.
+        """
+        if key not in self._in_flight:
+            self._in_flight[key] = []
+            task = asyncio.create_task(self._request(key, user_message, on_reply))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        
+        updates = asyncio.Queue()
+        subscribers = self._in_flight[key]
+        subscribers.append(updates)
         try:
-            response = llm_chain.predict(user_message=user_message)
-            return response
+            while True:
+                done, reply = await updates.get()
+                yield reply
+                if done:
+                    return
+        finally:
+            subscribers.remove(updates)
+    
+    async def _request(self, key, user_message, on_reply):
+        """Run the LLM request for key, publishing every update to its subscribers"""
+        subscribers = self._in_flight[key]
+        reply = None
+        try:
+            async for partial_reply in _stream_llm_reply_with_retry(user_message):
+                for updates in subscribers:
+                    updates.put_nowait((False, partial_reply))
+            reply = partial_reply
         except Exception as e:
             print(f"LLM chain error: {e}")
-            return get_fallback_response(user_message)
-    else:
-        return get_fallback_response(user_message)
+        finally:
+            del self._in_flight[key]
+            for updates in subscribers:
+                updates.put_nowait((True, reply))
+        
+        _record_llm_result(succeeded=reply is not None)
+        if reply is not None:
+            await on_reply(reply)
+
+_llm_batcher = LLMBatcher()
+
+async def _get_text_response_fallback(user_message, history=None):
+    """Yield the canned fallback response"""
+    yield get_fallback_response(user_message)
+
+async def _get_text_response_llm(user_message, history=None):
+    """Stream text response from the LLM, yielding the reply so far"""
+    # The chain is built on first use, so construction can still fail here
+    if get_chain() is None:
+        yield get_fallback_response(user_message)
+        return
+    
+    cache_key = _text_cache_key(user_message, history)
+    with _text_cache_lock:
+        cached_reply = _text_cache.get(cache_key)
+    # Only opening turns use the semantic cache: later replies depend on the
+    # conversation, which an embedding of the message alone doesn't capture
+    use_semantic_cache = SEMANTIC_CACHE_AVAILABLE and not history
+    embedding = None
+    if cached_reply is None and use_semantic_cache:
+        embedding, cached_reply = await _run_semantic_cache(_semantic_lookup, user_message) or (None, None)
+    if cached_reply is not None:
+        _remember_turn(user_message, cached_reply)
+        yield cached_reply
+        return
+    if _llm_circuit_open():
+        yield get_fallback_response(user_message)
+        return
+
+    async def cache_reply(reply):
+        with _text_cache_lock:
+            _text_cache[cache_key] = reply
+        if use_semantic_cache and embedding is not None:
+            await _run_semantic_cache(_semantic_store, embedding, reply)
+
+    # Join an identical turn that is already being generated rather than
+    # calling OpenAI again; only the turn that started it is saved by the chain
+    shared = _llm_batcher.is_in_flight(cache_key)
+    reply = None
+    async for reply in _llm_batcher.stream(cache_key, user_message, on_reply=cache_reply):
+        if reply is not None:
+            yield reply
+
+    if reply is None:
+        yield get_fallback_response(user_message)
+    elif shared:
+        _remember_turn(user_message, reply)
+
+# Pick the text path once: without LangChain or an API key every turn is a fallback
+if LANGCHAIN_AVAILABLE and OPENAI_API_KEY:
+    get_text_response = _get_text_response_llm
+else:
+    get_text_response = _get_text_response_fallback
 
 # Murf AI Configuration
-MURFAI_URL = "https://api.murf.ai/v1/speech/generate"
+# The streaming endpoint returns MP3 bytes as they are synthesized, so playback
+# can start before the whole reply is rendered
+MURFAI_URL = "https://api.murf.ai/v1/speech/stream"
 MURF_VOICE_ID = "Caleb"
 
 headers_murf = {
-    "accept": "application/json",
+    "accept": "audio/mpeg",
     "content-type": "application/json",
     "Authorization": f"Bearer {MURFAI_API_KEY}",
 }
 
-def get_generated_audio(text):
-    """Generate audio using Murf AI API"""
+# Payload fields that don't change between requests
+MURF_PAYLOAD_TEMPLATE = {
+    "voiceId": MURF_VOICE_ID,
+    "format": "MP3"
+}
+
+# orjson serializes the payload faster than the stdlib when it is installed
+try:
+    import orjson
+    _dump_json = orjson.dumps
+except ImportError:
+    def _dump_json(obj):
+        return json.dumps(obj).encode()
+
+# HTTP/2 lets concurrent turns multiplex over one TLS connection (needs httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+if not HTTP2_AVAILABLE:
+    print("⚠ h2 not installed, Murf AI requests will use HTTP/1.1")
+
+# Persistent keep-alive pool so the TCP+TLS handshake is paid once, not per turn
+MURF_RETRY_STATUSES = {502, 503, 504}
+MURF_MAX_RETRIES = 2
+MURF_BACKOFF_FACTOR = 0.2
+
+_murf_client = httpx.AsyncClient(
+    headers=headers_murf,
+    timeout=httpx.Timeout(30.0),
+    transport=httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        retries=MURF_MAX_RETRIES,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ),
+)
+
+# Recently played audio kept as MP3 bytes, in front of the on-disk audio cache
+_audio_cache = TTLCache(maxsize=64, ttl=3600)
+_audio_cache_lock = threading.Lock()
+
+# On-disk audio cache lives on tmpfs where available (no block-device writes)
+# and is capped at the most recently written files
+AUDIO_DIR = "/dev/shm/travelbot" if os.path.isdir("/dev/shm") else os.path.join(tempfile.gettempdir(), "travelbot")
+AUDIO_CACHE_MAX_FILES = 128
+os.makedirs(AUDIO_DIR, exist_ok=True)
+
+def _audio_file_mtime(path):
+    """Modification time for sorting, treating files deleted meanwhile as oldest"""
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return 0.0
+
+# Oldest first, seeded with files left behind by a previous run
+_audio_files = deque(sorted(glob.glob(os.path.join(AUDIO_DIR, "audio_*.mp3")), key=_audio_file_mtime))
+
+def _evict_audio_files():
+    """Delete the oldest cached audio files beyond AUDIO_CACHE_MAX_FILES"""
+    while len(_audio_files) > AUDIO_CACHE_MAX_FILES:
+        try:
+            os.remove(_audio_files.popleft())
+        except FileNotFoundError:
+            pass
+
+_evict_audio_files()
+
+def _read_cached_audio(path):
+    """MP3 bytes of a cached audio file, or None if it isn't (or is no longer) there"""
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+def _audio_cache_path(text):
+    """On-disk cache location of the synthesized audio for a reply"""
+    text_hash = hashlib.blake2b(f"{MURF_VOICE_ID}:{text}".encode(), digest_size=8).hexdigest()
+    return os.path.join(AUDIO_DIR, f"audio_{text_hash}.mp3")
+
+async def warm_murf_connection():
+    """Open a connection to Murf AI ahead of the TTS request"""
     if not MURFAI_API_KEY:
-        return {
-            "type": "ERROR",
-            "audio_url": "",
-            "response": "Murf AI API key not configured"
-        }
-    
-    payload = {
-        "voiceId": MURF_VOICE_ID,
-        "text": text,
-        "format": "MP3"
-    }
-    
-    generated_response = {
-        "type": "",
-        "audio_url": "",
-        "response": ""
-    }
+        return
+    try:
+        await _murf_client.head(MURFAI_URL)
+    except httpx.HTTPError:
+        pass
+
+async def open_murf_stream(body):
+    """Start a streamed Murf AI request, retrying transient gateway errors with backoff"""
+    for attempt in range(MURF_MAX_RETRIES + 1):
+        # The client's headers already declare the JSON content type
+        request = _murf_client.build_request("POST", MURFAI_URL, content=body)
+        response = await _murf_client.send(request, stream=True)
+        if response.status_code not in MURF_RETRY_STATUSES or attempt == MURF_MAX_RETRIES:
+            return response
+        await response.aclose()
+        await asyncio.sleep(MURF_BACKOFF_FACTOR * 2 ** attempt)
+
+AUDIO_CHUNK_SIZE = 64 * 1024
+AUDIO_WRITE_BATCH_SIZE = 256 * 1024
+
+async def stream_generated_audio(text):
+    """Stream MP3 audio from Murf AI as it is synthesized"""
+    body = _dump_json({**MURF_PAYLOAD_TEMPLATE, "text": text})
     
+    response = await open_murf_stream(body)
     try:
-        response = requests.post(MURFAI_URL, json=payload, headers=headers_murf, timeout=30)
         response.raise_for_status()
-        data = response.json()
-        
-        # Murf returns audioFile directly
-        audio_url = data.get("audioFile", "")
-        if audio_url:
-            generated_response["type"] = "SUCCESS"
-            generated_response["audio_url"] = audio_url
-            generated_response["response"] = data
-        else:
-            generated_response["type"] = "ERROR"
-            generated_response["response"] = f"No audio URL returned. Response: {data}"
-            
-    except requests.exceptions.RequestException as e:
-        generated_response["type"] = "ERROR"
-        generated_response["response"] = f"API Request failed: {str(e)}"
-    except Exception as e:
-        generated_response["type"] = "ERROR"
-        generated_response["response"] = f"Unexpected error: {str(e)}"
-        
-    return generated_response
-
-def download_audio_file(url):
-    """Download audio file from URL"""
-    final_response = {
-        "content": None,
-        "error": "",
-        "filename": ""
-    }
+        async for chunk in response.aiter_bytes(AUDIO_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await response.aclose()
+
+async def cache_audio_stream(chunks, dest_path):
+    """Pass audio chunks through while saving them to dest_path"""
+    # Write to a unique temporary file so an interrupted or concurrent stream
+    # never leaves a partial file under the cached name
+    completed = False
     
+    # Batch chunks so each thread hop and write syscall covers several network reads
+    f = await run_blocking(partial(
+        tempfile.NamedTemporaryFile, "wb", dir=AUDIO_DIR, suffix=".part", delete=False
+    ))
+    batch, batch_size = [], 0
     try:
-        response = requests.get(url, timeout=15, stream=True)
-        
-        if response.status_code != 200:
-            final_response["error"] = f"Download failed. Status: {response.status_code}"
-            return final_response
-            
-        content_type = response.headers.get("Content-Type", "")
-        
-        # Generate filename
-        import hashlib
-        filename_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-        filename = f"audio_{filename_hash}.mp3"
-        content = response.content
-        
-        final_response["content"] = content
-        final_response["filename"] = filename
-        
-    except Exception as e:
-        final_response["error"] = f"Download error: {str(e)}"
+        async for chunk in chunks:
+            batch.append(chunk)
+            batch_size += len(chunk)
+            if batch_size >= AUDIO_WRITE_BATCH_SIZE:
+                await run_blocking(f.write, b"".join(batch))
+                batch, batch_size = [], 0
+            yield chunk
+        await run_blocking(f.write, b"".join(batch))
+        completed = True
+    finally:
+        await run_blocking(f.close)
+        if completed:
+            await run_blocking(os.replace, f.name, dest_path)
+            # A re-synthesized file moves to the newest end instead of being listed twice
+            if dest_path in _audio_files:
+                _audio_files.remove(dest_path)
+            _audio_files.append(dest_path)
+            await run_blocking(_evict_audio_files)
+        else:
+            await run_blocking(os.remove, f.name)
+
+class AudioBatcher:
+    """Share one Murf stream between concurrent turns speaking the same reply
+    
+    Turns that join late first receive the chunks already streamed, so each
+    of them gets the complete MP3.
+    """
+    
+    def __init__(self):
+        self._in_flight = {}
+        self._tasks = set()
+    
+    async def stream(self, filename, text):
+        """Yield the MP3 chunks for text as they arrive, stopping early if synthesis fails"""
+        if filename not in self._in_flight:
+            self._in_flight[filename] = ([], [])
+            task = asyncio.create_task(self._synthesize(filename, text))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
         
-    return final_response
+        chunks, subscribers = self._in_flight[filename]
+        updates = asyncio.Queue()
+        for chunk in chunks:
+            updates.put_nowait((False, chunk))
+        subscribers.append(updates)
+        try:
+            while True:
+                done, chunk = await updates.get()
+                if done:
+                    return
+                yield chunk
+        finally:
+            subscribers.remove(updates)
+    
+    async def _synthesize(self, filename, text):
+        """Stream text from Murf into the audio cache, publishing every chunk to subscribers"""
+        chunks, subscribers = self._in_flight[filename]
+        try:
+            async for chunk in cache_audio_stream(stream_generated_audio(text), filename):
+                chunks.append(chunk)
+                for updates in subscribers:
+                    updates.put_nowait((False, chunk))
+            with _audio_cache_lock:
+                _audio_cache[filename] = b"".join(chunks)
+        except Exception as e:
+            print(f"Murf AI request failed: {e}")
+        finally:
+            del self._in_flight[filename]
+            for updates in subscribers:
+                updates.put_nowait((True, None))
+
+_audio_batcher = AudioBatcher()
 
-def get_text_and_audio_response(user_message):
-    """Get both text and audio responses"""
-    # 1. Get text response
-    text_reply = get_text_response(user_message)
+async def get_text_and_audio_response(user_message, history=None):
+    """Get both text and audio responses, yielding the text before the audio is ready"""
+    # 1. Stream the text response as it is generated
+    async for text_reply in get_text_response(user_message, history):
+        yield text_reply, None
 
-    # 2. Generate audio (if Murf AI is configured)
+    # 2. Stream audio (if Murf AI is configured)
     if MURFAI_API_KEY:
-        audio_event = get_generated_audio(text_reply)
-        
-        if audio_event["type"] == "SUCCESS":
-            audio_url = audio_event["audio_url"]
-            
-            # 3. Download audio file
-            download_result = download_audio_file(audio_url)
-            
-            if not download_result["error"]:
-                # Save audio file
-                filename = download_result["filename"]
-                with open(filename, "wb") as f:
-                    f.write(download_result["content"])
-                return text_reply, filename
-    
-    # Return text only if audio generation fails or Murf AI not configured
-    return text_reply, None
+        # Reuse audio already synthesized for the same reply, handing Gradio
+        # the MP3 bytes directly rather than a path it has to re-open
+        filename = _audio_cache_path(text_reply)
+        with _audio_cache_lock:
+            audio_bytes = _audio_cache.get(filename)
+        if audio_bytes is None:
+            # Eviction (here or in another worker) can remove the file at any time
+            audio_bytes = await run_blocking(_read_cached_audio, filename)
+        if audio_bytes is not None:
+            with _audio_cache_lock:
+                _audio_cache[filename] = audio_bytes
+            yield text_reply, audio_bytes
+            return
 
-def chat_bot_response(message, history):
+        # Play each chunk as it arrives; identical replies share one Murf stream
+        async for chunk in _audio_batcher.stream(filename, text_reply):
+            yield text_reply, chunk
+
+async def chat_bot_response(message, history):
     """Gradio chat interface response handler"""
-    text_reply, audio_file = get_text_and_audio_response(message)
-    
-    # Update chat history
     if history is None:
         history = []
-    history.append((message, text_reply))
+    new_history = list(history)
     
-    # Return both text and audio if available
-    if audio_file and os.path.exists(audio_file):
-        return history, history, audio_file
-    
-    # Return only text if audio failed
-    return history, history, None
+    async for text_reply, audio in get_text_and_audio_response(message, history):
+        # Update chat history
+        new_history[len(history):] = [(message, text_reply)]
+        
+        # Audio arrives as a stream of chunks after the text (None until then)
+        yield new_history, new_history, audio
 
 # Create Gradio interface
 with gr.Blocks(title="🌍 Travel Voice Chatbot", theme=gr.themes.Soft()) as demo:
@@ -249,7 +681,7 @@ with gr.Blocks(title="🌍 Travel Voice Chatbot", theme=gr.themes.Soft()) as dem
         )
         submit_btn = gr.Button("Send", variant="primary", scale=1)
     
-    audio_output = gr.Audio(label="Voice Response", autoplay=True)
+    audio_output = gr.Audio(label="Voice Response", autoplay=True, streaming=True)
     clear_btn = gr.Button("Clear Chat")
     
     examples = gr.Examples(
@@ -264,9 +696,17 @@ with gr.Blocks(title="🌍 Travel Voice Chatbot", theme=gr.themes.Soft()) as dem
         label="Example Questions"
     )
     
-    def respond(message, chat_history):
-        new_history, _, audio = chat_bot_response(message, chat_history)
-        return "", new_history, audio
+    async def respond(message, chat_history):
+        # Warm the Murf connection while the LLM is still generating
+        warm_task = asyncio.create_task(warm_murf_connection())
+        async for new_history, _, audio in chat_bot_response(message, chat_history):
+            # Leave the streaming audio output out of text-only updates: it only
+            # accepts audio chunks, and a None chunk would end its stream
+            if audio is None:
+                yield {msg: "", chatbot: new_history}
+            else:
+                yield {msg: "", chatbot: new_history, audio_output: audio}
+        await warm_task
     
     msg.submit(
         respond,
@@ -285,5 +725,8 @@ with gr.Blocks(title="🌍 Travel Voice Chatbot", theme=gr.themes.Soft()) as dem
         outputs=[chatbot, audio_output]
     )
 
+    # Warm the Murf connection pool before the first user turn
+    demo.load(warm_murf_connection)
+
 if __name__ == "__main__":
     demo.launch(share=False, debug=True)